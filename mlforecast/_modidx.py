@@ -138,7 +138,13 @@ d = { 'settings': { 'branch': 'main',
                                                  'mlforecast.distributed.forecast.DistributedMLForecast.to_local': ( 'distributed.forecast.html#distributedmlforecast.to_local',
                                                                                                                      'mlforecast/distributed/forecast.py'),
                                                  'mlforecast.distributed.forecast.DistributedMLForecast.update': ( 'distributed.forecast.html#distributedmlforecast.update',
-                                                                                                                   'mlforecast/distributed/forecast.py')},
+                                                                                                                   'mlforecast/distributed/forecast.py'),
+                                                 'mlforecast.distributed.forecast._is_dask_df': ( 'distributed.forecast.html#_is_dask_df',
+                                                                                                  'mlforecast/distributed/forecast.py'),
+                                                 'mlforecast.distributed.forecast._is_ray_dataset': ( 'distributed.forecast.html#_is_ray_dataset',
+                                                                                                      'mlforecast/distributed/forecast.py'),
+                                                 'mlforecast.distributed.forecast._is_spark_df': ( 'distributed.forecast.html#_is_spark_df',
+                                                                                                   'mlforecast/distributed/forecast.py')},
             'mlforecast.distributed.models.dask.lgb': { 'mlforecast.distributed.models.dask.lgb.DaskLGBMForecast': ( 'distributed.models.dask.lgb.html#dasklgbmforecast',
                                                                                                                      'mlforecast/distributed/models/dask/lgb.py'),
                                                         'mlforecast.distributed.models.dask.lgb.DaskLGBMForecast.model_': ( 'distributed.models.dask.lgb.html#dasklgbmforecast.model_',
@@ -349,13 +355,19 @@ d = { 'settings': { 'branch': 'main',
                                                                                                 'mlforecast/lag_transforms.py'),
                                            'mlforecast.lag_transforms._Seasonal_RollingBase.__init__': ( 'lag_transforms.html#_seasonal_rollingbase.__init__',
                                                                                                          'mlforecast/lag_transforms.py'),
+                                           'mlforecast.lag_transforms._get_init_params': ( 'lag_transforms.html#_get_init_params',
+                                                                                           'mlforecast/lag_transforms.py'),
                                            'mlforecast.lag_transforms._pascal2camel': ( 'lag_transforms.html#_pascal2camel',
                                                                                         'mlforecast/lag_transforms.py')},
             'mlforecast.lgb_cv': { 'mlforecast.lgb_cv.LightGBMCV': ('lgb_cv.html#lightgbmcv', 'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv.LightGBMCV.__init__': ('lgb_cv.html#lightgbmcv.__init__', 'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv.LightGBMCV.__repr__': ('lgb_cv.html#lightgbmcv.__repr__', 'mlforecast/lgb_cv.py'),
+                                   'mlforecast.lgb_cv.LightGBMCV._compute_metric': ( 'lgb_cv.html#lightgbmcv._compute_metric',
+                                                                                     'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv.LightGBMCV._multithreaded_partial_fit': ( 'lgb_cv.html#lightgbmcv._multithreaded_partial_fit',
                                                                                                 'mlforecast/lgb_cv.py'),
+                                   'mlforecast.lgb_cv.LightGBMCV._predict_and_evaluate': ( 'lgb_cv.html#lightgbmcv._predict_and_evaluate',
+                                                                                           'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv.LightGBMCV._single_threaded_partial_fit': ( 'lgb_cv.html#lightgbmcv._single_threaded_partial_fit',
                                                                                                   'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv.LightGBMCV.find_best_iter': ( 'lgb_cv.html#lightgbmcv.find_best_iter',
@@ -368,8 +380,10 @@ d = { 'settings': { 'branch': 'main',
                                    'mlforecast.lgb_cv.LightGBMCV.should_stop': ( 'lgb_cv.html#lightgbmcv.should_stop',
                                                                                  'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv._mape': ('lgb_cv.html#_mape', 'mlforecast/lgb_cv.py'),
+                                   'mlforecast.lgb_cv._mean_by_id': ('lgb_cv.html#_mean_by_id', 'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv._predict': ('lgb_cv.html#_predict', 'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv._rmse': ('lgb_cv.html#_rmse', 'mlforecast/lgb_cv.py'),
+                                   'mlforecast.lgb_cv._to_float_array': ('lgb_cv.html#_to_float_array', 'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv._update': ('lgb_cv.html#_update', 'mlforecast/lgb_cv.py'),
                                    'mlforecast.lgb_cv._update_and_predict': ('lgb_cv.html#_update_and_predict', 'mlforecast/lgb_cv.py')},
             'mlforecast.optimization': { 'mlforecast.optimization.mlforecast_objective': ( 'optimization.html#mlforecast_objective',
@@ -483,6 +497,7 @@ d = { 'settings': { 'branch': 'main',
                                   'mlforecast.utils._ShortSeriesException.__init__': ( 'utils.html#_shortseriesexception.__init__',
                                                                                        'mlforecast/utils.py'),
                                   'mlforecast.utils._ensure_shallow_copy': ('utils.html#_ensure_shallow_copy', 'mlforecast/utils.py'),
+                                  'mlforecast.utils._pandas_lt_1_4': ('utils.html#_pandas_lt_1_4', 'mlforecast/utils.py'),
                                   'mlforecast.utils.generate_daily_series': ('utils.html#generate_daily_series', 'mlforecast/utils.py'),
                                   'mlforecast.utils.generate_prices_for_series': ( 'utils.html#generate_prices_for_series',
                                                                                    'mlforecast/utils.py')}}}
@@ -702,7 +702,8 @@ class TimeSeries:
         statics = self.static_features_
         last_dates = self.last_dates
         targ_tfms = copy.copy(self.target_transforms)
-        lag_tfms = copy.deepcopy(self.transforms)
+        # the subsets are new objects, so we only need to keep a reference to the originals
+        lag_tfms = self.transforms
 
         if idxs is not None:
             # assign subsets
@@ -715,10 +716,14 @@ class TimeSeries:
                 for i, tfm in enumerate(self.target_transforms):
                     if isinstance(tfm, _BaseGroupedArrayTargetTransform):
                         self.target_transforms[i] = tfm.take(idxs)
-            for name, lag_tfm in self.transforms.items():
-                if isinstance(lag_tfm, _BaseLagTransform):
-                    lag_tfm = lag_tfm.take(idxs)
-                self.transforms[name] = lag_tfm
+            self.transforms = {
+                name: (
+                    lag_tfm.take(idxs)
+                    if isinstance(lag_tfm, _BaseLagTransform)
+                    else lag_tfm
+                )
+                for name, lag_tfm in lag_tfms.items()
+            }
         try:
             yield
         finally:
@@ -727,7 +732,9 @@ class TimeSeries:
             self.static_features_ = statics
             self.last_dates = last_dates
             self.target_transforms = targ_tfms
-            self.lag_tfms = lag_tfms
+            if idxs is not None:
+                # when predicting for all series the transforms are restored by _backup
+                self.transforms = lag_tfms
 
     def predict(
         self,
@@ -5,38 +5,17 @@ __all__ = ['DistributedMLForecast']
 
 # %% ../../nbs/distributed.forecast.ipynb 5
 import copy
+import sys
 from collections import namedtuple
 from typing import Any, Callable, Iterable, List, Optional
 
 import cloudpickle
 import fsspec
-
-try:
-    import dask.dataframe as dd
-
-    DASK_INSTALLED = True
-except ModuleNotFoundError:
-    DASK_INSTALLED = False
 import fugue
 import fugue.api as fa
 import numpy as np
 import pandas as pd
 import utilsforecast.processing as ufp
-
-try:
-    from pyspark.ml.feature import VectorAssembler
-    from pyspark.sql import DataFrame as SparkDataFrame
-
-    SPARK_INSTALLED = True
-except ModuleNotFoundError:
-    SPARK_INSTALLED = False
-try:
-    from lightgbm_ray import RayDMatrix
-    from ray.data import Dataset as RayDataset
-
-    RAY_INSTALLED = True
-except ModuleNotFoundError:
-    RAY_INSTALLED = False
 from sklearn.base import clone
 
 from mlforecast.core import (
@@ -57,6 +36,32 @@ WindowInfo = namedtuple(
     "WindowInfo", ["n_windows", "window_size", "step_size", "i_window", "input_size"]
 )
 
+
+# the engines are imported only when the data comes from them,
+# which saves importing them just to run isinstance checks
+def _is_spark_df(data) -> bool:
+    if "pyspark.sql" not in sys.modules:
+        return False
+    from pyspark.sql import DataFrame as SparkDataFrame
+
+    return isinstance(data, SparkDataFrame)
+
+
+def _is_dask_df(data) -> bool:
+    if "dask.dataframe" not in sys.modules:
+        return False
+    import dask.dataframe as dd
+
+    return isinstance(data, dd.DataFrame)
+
+
+def _is_ray_dataset(data) -> bool:
+    if "ray.data" not in sys.modules:
+        return False
+    from ray.data import Dataset as RayDataset
+
+    return isinstance(data, RayDataset)
+
 # %% ../../nbs/distributed.forecast.ipynb 7
 class DistributedMLForecast:
     """Multi backend distributed pipeline"""
@@ -233,9 +238,7 @@ class DistributedMLForecast:
     ) -> List[Any]:
         if self.num_partitions:
             partition = dict(by=id_col, num=self.num_partitions, algo="coarse")
-        elif RAY_INSTALLED and isinstance(
-            data, RayDataset
-        ):  # num partitions is None but data is a RayDataset
+        elif _is_ray_dataset(data):  # num partitions is None but data is a RayDataset
             # We need to add this because
             # currently ray doesnt support partitioning a Dataset
             # based on a column.
@@ -376,18 +379,22 @@ class DistributedMLForecast:
             if x not in {id_col, time_col, target_col}
         ]
         self.models_ = {}
-        if SPARK_INSTALLED and isinstance(data, SparkDataFrame):
+        if _is_spark_df(data):
+            from pyspark.ml.feature import VectorAssembler
+
             featurizer = VectorAssembler(inputCols=features, outputCol="features")
             train_data = featurizer.transform(prep)[target_col, "features"]
             for name, model in self.models.items():
                 trained_model = model._pre_fit(target_col).fit(train_data)
                 self.models_[name] = model.extract_local_model(trained_model)
-        elif DASK_INSTALLED and isinstance(data, dd.DataFrame):
+        elif _is_dask_df(data):
             X, y = prep[features], prep[target_col]
             for name, model in self.models.items():
                 trained_model = clone(model).fit(X, y)
                 self.models_[name] = trained_model.model_
-        elif RAY_INSTALLED and isinstance(data, RayDataset):
+        elif _is_ray_dataset(data):
+            from lightgbm_ray import RayDMatrix
+
             X = RayDMatrix(
                 prep.select_columns(cols=features + [target_col]),
                 label=target_col,
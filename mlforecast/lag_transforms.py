@@ -8,9 +8,10 @@ __all__ = ['RollingMean', 'RollingStd', 'RollingMin', 'RollingMax', 'RollingQuan
 
 # %% ../nbs/lag_transforms.ipynb 3
 import copy
+import functools
 import inspect
 import re
-from typing import Callable, Optional, Sequence
+from typing import Callable, Optional, Sequence, Tuple, Type
 
 import numpy as np
 import coreforecast.lag_transforms as core_tfms
@@ -22,13 +23,19 @@ def _pascal2camel(pascal_str: str) -> str:
     return re.sub(r"(?<!^)(?=[A-Z])", "_", pascal_str).lower()
 
 # %% ../nbs/lag_transforms.ipynb 5
+@functools.lru_cache(maxsize=None)
+def _get_init_params(cls: Type["_BaseLagTransform"]) -> Tuple[inspect.Parameter, ...]:
+    # the signature only depends on the class, so we compute it once
+    return tuple(
+        p
+        for name, p in inspect.signature(cls.__init__).parameters.items()
+        if name != "self"
+    )
+
+
 class _BaseLagTransform(BaseEstimator):
     def _get_init_signature(self):
-        return {
-            k: v
-            for k, v in inspect.signature(self.__class__.__init__).parameters.items()
-            if k != "self"
-        }
+        return {p.name: p for p in _get_init_params(self.__class__)}
 
     def _set_core_tfm(self, lag: int) -> "_BaseLagTransform":
         init_args = {k: getattr(self, k) for k in self._get_init_signature()}
@@ -25,14 +25,44 @@ from mlforecast.core import (
 )
 
 # %% ../nbs/lgb_cv.ipynb 5
+def _to_float_array(values) -> np.ndarray:
+    # nullable dtypes hold pd.NA, which has to be mapped to nan before the cast
+    return pd.Series(values).to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _mean_by_id(values, ids) -> np.ndarray:
+    """Mean of `values` for each id, ignoring nulls (like `groupby(ids).mean()`)."""
+    codes, uniques = pd.factorize(ids)
+    values = np.asarray(values, dtype=np.float64)
+    mask = (codes >= 0) & ~np.isnan(values)
+    codes = codes[mask]
+    sums = np.bincount(codes, weights=values[mask], minlength=len(uniques))
+    counts = np.bincount(codes, minlength=len(uniques))
+    keep = counts > 0
+    return sums[keep] / counts[keep]
+
+
 def _mape(y_true, y_pred, ids, _dates):
-    abs_pct_err = abs(y_true - y_pred) / y_true
-    return abs_pct_err.groupby(ids, observed=True).mean().mean()
+    y_true = _to_float_array(y_true)
+    # compute the errors in a single buffer to avoid intermediate allocations.
+    # zero targets produce inf or nan, which pandas returned without warning
+    with np.errstate(divide="ignore", invalid="ignore"):
+        abs_pct_err = np.subtract(y_true, _to_float_array(y_pred))
+        np.abs(abs_pct_err, out=abs_pct_err)
+        np.divide(abs_pct_err, y_true, out=abs_pct_err)
+    means = _mean_by_id(abs_pct_err, ids)
+    if not means.size:
+        return np.nan
+    return means.mean()
 
 
 def _rmse(y_true, y_pred, ids, _dates):
-    sq_err = (y_true - y_pred) ** 2
-    return sq_err.groupby(ids, observed=True).mean().pow(0.5).mean()
+    sq_err = np.subtract(_to_float_array(y_true), _to_float_array(y_pred))
+    np.square(sq_err, out=sq_err)
+    means = _mean_by_id(sq_err, ids)
+    if not means.size:
+        return np.nan
+    return np.sqrt(means).mean()
 
 
 _metric2fn = {"mape": _mape, "rmse": _rmse}
@@ -66,10 +96,10 @@ def _update_and_predict(
     _update(bst, n)
     return _predict(ts, bst, valid, h, before_predict_callback, after_predict_callback)
 
-# %% ../nbs/lgb_cv.ipynb 6
+# %% ../nbs/lgb_cv.ipynb 7
 CVResult = Tuple[int, float]
 
-# %% ../nbs/lgb_cv.ipynb 7
+# %% ../nbs/lgb_cv.ipynb 8
 class LightGBMCV:
     def __init__(
         self,
@@ -247,12 +277,33 @@ class LightGBMCV:
                 before_predict_callback=before_predict_callback,
                 after_predict_callback=after_predict_callback,
             )
-            metric_values[j] = self.metric_fn(
-                preds[self.target_col],
-                preds["Booster"],
-                preds[self.id_col],
-                preds[self.time_col],
-            )
+            metric_values[j] = self._compute_metric(preds)
+
+    def _compute_metric(self, preds: pd.DataFrame) -> float:
+        return self.metric_fn(
+            preds[self.target_col],
+            preds["Booster"],
+            preds[self.id_col],
+            preds[self.time_col],
+        )
+
+    def _predict_and_evaluate(
+        self,
+        ts: TimeSeries,
+        bst: lgb.Booster,
+        valid: pd.DataFrame,
+        before_predict_callback: Optional[Callable] = None,
+        after_predict_callback: Optional[Callable] = None,
+    ) -> float:
+        preds = _predict(
+            ts=ts,
+            bst=bst,
+            valid=valid,
+            h=self.h,
+            before_predict_callback=before_predict_callback,
+            after_predict_callback=after_predict_callback,
+        )
+        return self._compute_metric(preds)
 
     def _multithreaded_partial_fit(
         self,
@@ -265,26 +316,17 @@ class LightGBMCV:
             futures = []
             for ts, bst, valid in self.items:
                 _update(bst, num_iterations)
+                # compute the metric in the worker as well so that it overlaps with the other windows
                 future = executor.submit(
-                    _predict,
+                    self._predict_and_evaluate,
                     ts=ts,
                     bst=bst,
                     valid=valid,
-                    h=self.h,
                     before_predict_callback=before_predict_callback,
                     after_predict_callback=after_predict_callback,
                 )
                 futures.append(future)
-            cv_preds = [f.result() for f in futures]
-        metric_values[:] = [
-            self.metric_fn(
-                preds[self.target_col],
-                preds["Booster"],
-                preds[self.id_col],
-                preds[self.time_col],
-            )
-            for preds in cv_preds
-        ]
+            metric_values[:] = [f.result() for f in futures]
 
     def partial_fit(
         self,
@@ -4,6 +4,7 @@
 __all__ = ['generate_daily_series', 'generate_prices_for_series', 'PredictionIntervals']
 
 # %% ../nbs/utils.ipynb 3
+import functools
 from math import ceil, log10
 
 import numpy as np
@@ -133,10 +134,16 @@ class PredictionIntervals:
         return f"PredictionIntervals(n_windows={self.n_windows}, h={self.h}, method='{self.method}')"
 
 # %% ../nbs/utils.ipynb 20
-def _ensure_shallow_copy(df: pd.DataFrame) -> pd.DataFrame:
+@functools.lru_cache(maxsize=None)
+def _pandas_lt_1_4() -> bool:
+    # this gets called on every transform, so we only parse the versions once
     from packaging.version import Version
 
-    if Version(pd.__version__) < Version("1.4"):
+    return Version(pd.__version__) < Version("1.4")
+
+
+def _ensure_shallow_copy(df: pd.DataFrame) -> pd.DataFrame:
+    if _pandas_lt_1_4():
         # https://github.com/pandas-dev/pandas/pull/43406
         df = df.copy()
     return df